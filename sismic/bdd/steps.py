@@ -128,7 +128,7 @@ def event_is_fired(context, name, parameter=None, value=None):
 
     test = testing.event_is_fired(context.monitored_trace, name, parameters)
 
-    if len(parameters) == 0:
+    if not parameters:
         assert test, 'Event {} is not fired'.format(name)
     else:
         assert test, 'Event {} is not fired with parameters {}'.format(name, parameters)
@@ -143,7 +143,7 @@ def event_is_not_fired(context, name):
 @then('no event is fired')
 def no_event_is_fired(context):
     for macrostep in context.monitored_trace:
-        if len(macrostep.sent_events) > 0:
+        if macrostep.sent_events:
             if len(macrostep.sent_events) > 1:
                 assert False, 'Events {} are fired'.format(
                     ', '.join([e.name for e in macrostep.sent_events]))
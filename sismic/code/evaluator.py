@@ -70,7 +70,7 @@ class Evaluator(metaclass=abc.ABCMeta):
         """
         if statechart.preamble:
             events = self._execute_code(statechart.preamble)
-            if len(events) > 0:
+            if events:
                 raise CodeEvaluationError('Events cannot be raised by statechart preamble')
 
     def evaluate_guard(
@@ -226,7 +226,7 @@ class PythonEvaluator(Evaluator):
         }
 
         # Deal with __old__ in contracts, only required if there is an invariant or a postcondition
-        if len(getattr(obj, 'invariants', [])) > 0 or len(getattr(obj, 'postconditions', [])) > 0:
+        if getattr(obj, 'invariants', None) or getattr(obj, 'postconditions', None):
             self._memory[id(obj)] = FrozenContext(self._context)
 
         return filter(
@@ -121,7 +121,7 @@ class Interpreter:
         """
         Boolean indicating whether this interpreter is in a final configuration.
         """
-        return self._initialized and len(self._configuration) == 0
+        return self._initialized and not self._configuration
 
     @property
     def statechart(self) -> Statechart:
@@ -305,7 +305,7 @@ class Interpreter:
         # Compute steps
         computed_steps = self._compute_steps()
 
-        if len(computed_steps) > 0:
+        if computed_steps:
 
             # Consume event if it triggered a transition
             if computed_steps[0].event is not None:
@@ -391,7 +391,7 @@ class Interpreter:
         for queue in cast(
                 Tuple[List[Tuple[float, Event]]],
                 (self._internal_queue, self._external_queue)):
-            if len(queue) > 0:
+            if queue:
                 time, event = queue[0]
                 if time <= self.time:
                     if consume:
@@ -443,7 +443,7 @@ class Interpreter:
         for has_event, transitions in sorted_groupby(
                 considered_transitions, key=eventless_first_order, reverse=not eventless_first):
             # If there are selected transitions (from previous group), ignore new ones
-            if len(selected_transitions) > 0:
+            if selected_transitions:
                 break
 
             # Event shouldn't be exposed to guards if we're processing eventless transition
@@ -556,7 +556,7 @@ class Interpreter:
         transitions = self._select_transitions(event, states=self._configuration)
 
         # No transition can be triggered?
-        if len(transitions) == 0:
+        if not transitions:
             if event is None:
                 # No event, no step!
                 return []
@@ -1,5 +1,5 @@
 from collections import OrderedDict
-from typing import Any, List, Mapping, MutableMapping, Optional, Tuple, cast
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Tuple, cast
 
 from ..exceptions import StatechartError
 from ..model import (ActionStateMixin, BasicState, CompositeStateMixin,
@@ -169,18 +169,83 @@ def export_to_dict(statechart: Statechart, ordered=True) -> Mapping[str, Any]:
     if statechart.preamble:
         d['preamble'] = statechart.preamble
 
-    d['root state'] = _export_state_to_dict(statechart, cast(str, statechart.root), ordered)
+    # Group transitions by source state, instead of looking for them for each state
+    transitions = {}  # type: Dict[str, List[Transition]]
+    for transition in statechart.transitions:
+        transitions.setdefault(transition.source, []).append(transition)
+
+    d['root state'] = _export_state_to_dict(
+        statechart, cast(str, statechart.root), transitions, ordered)
 
     return {'statechart': d}
 
 
+def _export_contract_to_list(obj: Any) -> List[Mapping[str, str]]:
+    """
+    Return the conditions of the contract of given object (a state or a transition).
+
+    :param obj: an object that may have preconditions, postconditions and invariants
+    :return: a (possibly empty) list of conditions
+    """
+    conditions = []  # type: List[Mapping[str, str]]
+    for condition in getattr(obj, 'preconditions', []):
+        conditions.append({'before': condition})
+    for condition in getattr(obj, 'postconditions', []):
+        conditions.append({'after': condition})
+    for condition in getattr(obj, 'invariants', []):
+        conditions.append({'always': condition})
+    return conditions
+
+
+def _export_transition_to_dict(transition: Transition, ordered=True) -> Mapping[str, Any]:
+    """
+    Export given transition to a dict.
+
+    :param transition: the transition to export
+    :param ordered: set to True to use an ordereddict instead of a dict
+    :return: a dict representing the transition
+    """
+    data = OrderedDict() if ordered else {}  # type: MutableMapping
+    if transition.event:
+        data['event'] = transition.event
+    if transition.guard:
+        data['guard'] = transition.guard
+    if transition.target:
+        data['target'] = transition.target
+    if transition.action:
+        data['action'] = transition.action
+    if transition.priority != Transition.DEFAULT_PRIORITY:
+        if transition.priority == Transition.LOW_PRIORITY:
+            priority = 'low'
+        elif transition.priority == Transition.HIGH_PRIORITY:
+            priority = 'high'
+        else:
+            priority = transition.priority
+        data['priority'] = priority
+
+    conditions = _export_contract_to_list(transition)
+    if conditions:
+        data['contract'] = conditions
+
+    return data
+
+
 def _export_state_to_dict(statechart: Statechart, state_name: str,
+                          transitions: Mapping[str, List[Transition]],
                           ordered=True) -> Mapping[str, Any]:
-    data = OrderedDict() if ordered else {}
+    """
+    Export given state and its descendants to a dict.
 
+    :param statechart: the statechart that contains the state
+    :param state_name: name of the state to export
+    :param transitions: the transitions of the statechart, grouped by source state
+    :param ordered: set to True to use an ordereddict instead of a dict
+    :return: a dict representing the state
+    """
     state = statechart.state_for(state_name)
 
-    data['name'] = state.name
+    data = OrderedDict() if ordered else {}  # type: MutableMapping
+    data['name'] = state_name
     if isinstance(state, ShallowHistoryState):
         data['type'] = 'shallow history'
         if state.memory:
@@ -202,62 +267,20 @@ def _export_state_to_dict(statechart: Statechart, state_name: str,
         if state.initial:
             data['initial'] = state.initial
 
-    preconditions = getattr(state, 'preconditions', [])
-    postconditions = getattr(state, 'postconditions', [])
-    invariants = getattr(state, 'invariants', [])
-    if preconditions or postconditions or invariants:
-        conditions = []
-        for condition in preconditions:
-            conditions.append({'before': condition})
-        for condition in postconditions:
-            conditions.append({'after': condition})
-        for condition in invariants:
-            conditions.append({'always': condition})
+    conditions = _export_contract_to_list(state)
+    if conditions:
         data['contract'] = conditions
 
     if isinstance(state, TransitionStateMixin):
         # event, guard, target, action
-        transitions = statechart.transitions_from(cast(StateMixin, state).name)
-        if len(transitions) > 0:
-            data['transitions'] = []
-
-            for transition in transitions:
-                transition_data = OrderedDict() if ordered else {}
-                if transition.event:
-                    transition_data['event'] = transition.event
-                if transition.guard:
-                    transition_data['guard'] = transition.guard
-                if transition.target:
-                    transition_data['target'] = transition.target
-                if transition.action:
-                    transition_data['action'] = transition.action
-                if transition.priority != Transition.DEFAULT_PRIORITY:
-                    if transition.priority == Transition.LOW_PRIORITY:
-                        priority = 'low'
-                    elif transition.priority == Transition.HIGH_PRIORITY:
-                        priority = 'high'
-                    else:
-                        priority = transition.priority
-                    transition_data['priority'] = priority
-
-                preconditions = getattr(transition, 'preconditions', [])
-                postconditions = getattr(transition, 'postconditions', [])
-                invariants = getattr(transition, 'invariants', [])
-                if preconditions or postconditions or invariants:
-                    conditions = []
-                    for condition in preconditions:
-                        conditions.append({'before': condition})
-                    for condition in postconditions:
-                        conditions.append({'after': condition})
-                    for condition in invariants:
-                        conditions.append({'always': condition})
-                    transition_data['contract'] = conditions
-
-                data['transitions'].append(transition_data)
+        state_transitions = transitions.get(state_name, [])
+        if state_transitions:
+            data['transitions'] = [
+                _export_transition_to_dict(t, ordered) for t in state_transitions]
 
     if isinstance(state, CompositeStateMixin):
-        children = statechart.children_for(cast(StateMixin, state).name)
-        children_data = [_export_state_to_dict(statechart, child, ordered) for child in children]
+        children_data = [_export_state_to_dict(statechart, child, transitions, ordered)
+                         for child in statechart.children_for(state_name)]
 
         if isinstance(state, CompoundState):
             data['states'] = children_data
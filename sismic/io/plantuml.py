@@ -136,7 +136,7 @@ class PlantUMLExporter:
             # Internal actions
             transitions = [tr for tr in self.statechart.transitions_from(
                 name) if tr.internal and tr.action]
-            if len(transitions) > 0:
+            if transitions:
                 for transition in transitions:
                     text = []
                     if transition.priority != Transition.DEFAULT_PRIORITY:
@@ -11,6 +11,8 @@ class ContractMixin(metaclass=ABCMeta):
     Mixin with a contract: preconditions, postconditions and invariants.
     """
 
+    __slots__ = ['preconditions', 'postconditions', 'invariants']
+
     def __init__(self) -> None:
         self.preconditions = []  # type: List[str]
         self.postconditions = []  # type: List[str]
@@ -34,6 +36,8 @@ class StateMixin(metaclass=ABCMeta):
     :param name: name of the state
     """
 
+    __slots__ = []
+
     def __init__(self, name: str) -> None:
         self._name = name
 
@@ -45,7 +49,9 @@ class StateMixin(metaclass=ABCMeta):
         return '{}({!r})'.format(self.__class__.__name__, self.name)
 
     def __eq__(self, other):
-        if isinstance(other, StateMixin):
+        if self is other:
+            return True
+        elif isinstance(other, StateMixin):
             return self.name == other.name
         else:
             return NotImplemented
@@ -62,13 +68,15 @@ class ActionStateMixin(metaclass=ABCMeta):
     :param on_exit: code to execute when state is exited
     """
 
+    __slots__ = []
+
     def __init__(self, on_entry: str = None, on_exit: str = None) -> None:
         self.on_entry = on_entry
         self.on_exit = on_exit
 
     def __eq__(self, other):
         if isinstance(other, ActionStateMixin):
-            return self.on_entry == other.on_exit and self.on_exit == other.on_exit
+            return self.on_entry == other.on_entry and self.on_exit == other.on_exit
         else:
             return NotImplemented
 
@@ -78,6 +86,8 @@ class TransitionStateMixin(metaclass=ABCMeta):
     A simple state can host transitions
     """
 
+    __slots__ = []
+
     def __eq__(self, other):
         return isinstance(other, TransitionStateMixin)
 
@@ -87,6 +97,8 @@ class CompositeStateMixin(metaclass=ABCMeta):
     Composite state can have children states.
     """
 
+    __slots__ = []
+
     def __eq__(self, other):
         return isinstance(other, CompositeStateMixin)
 
@@ -98,6 +110,8 @@ class HistoryStateMixin(metaclass=ABCMeta):
     :param memory: name of the initial state
     """
 
+    __slots__ = []
+
     def __init__(self, memory: str = None) -> None:
         self.memory = memory
 
@@ -117,14 +131,17 @@ class BasicState(ContractMixin, StateMixin, ActionStateMixin, TransitionStateMix
     :param on_exit: code to execute when state is exited
     """
 
+    __slots__ = ['_name', 'on_entry', 'on_exit']
+
     def __init__(self, name: str, on_entry: str = None, on_exit: str = None) -> None:
         ContractMixin.__init__(self)
         StateMixin.__init__(self, name)
         ActionStateMixin.__init__(self, on_entry, on_exit)
-        TransitionStateMixin.__init__(self)
 
     def __eq__(self, other):
-        if isinstance(other, BasicState):
+        if self is other:
+            return True
+        elif isinstance(other, BasicState):
             return (
                 ContractMixin.__eq__(self, other)
                 and StateMixin.__eq__(self, other)
@@ -146,17 +163,19 @@ class CompoundState(
     :param on_exit: code to execute when state is exited
     """
 
+    __slots__ = ['_name', 'on_entry', 'on_exit', 'initial']
+
     def __init__(self, name: str, initial: str = None,
                  on_entry: str = None, on_exit: str = None) -> None:
         ContractMixin.__init__(self)
         StateMixin.__init__(self, name)
         ActionStateMixin.__init__(self, on_entry, on_exit)
-        TransitionStateMixin.__init__(self)
-        CompositeStateMixin.__init__(self)
         self.initial = initial
 
     def __eq__(self, other):
-        if isinstance(other, CompoundState):
+        if self is other:
+            return True
+        elif isinstance(other, CompoundState):
             return (
                 ContractMixin.__eq__(self, other)
                 and StateMixin.__eq__(self, other)
@@ -178,15 +197,17 @@ class OrthogonalState(
     :param on_exit: code to execute when state is exited
     """
 
+    __slots__ = ['_name', 'on_entry', 'on_exit']
+
     def __init__(self, name: str, on_entry: str = None, on_exit: str = None) -> None:
         ContractMixin.__init__(self)
         StateMixin.__init__(self, name)
         ActionStateMixin.__init__(self, on_entry, on_exit)
-        TransitionStateMixin.__init__(self)
-        CompositeStateMixin.__init__(self)
 
     def __eq__(self, other):
-        if isinstance(other, OrthogonalState):
+        if self is other:
+            return True
+        elif isinstance(other, OrthogonalState):
             return (
                 ContractMixin.__eq__(self, other)
                 and StateMixin.__eq__(self, other)
@@ -209,6 +230,8 @@ class ShallowHistoryState(ContractMixin, StateMixin, ActionStateMixin, HistorySt
     :param memory: name of the initial state
     """
 
+    __slots__ = ['_name', 'on_entry', 'on_exit', 'memory']
+
     def __init__(self, name: str, on_entry: str = None,
                  on_exit: str = None, memory: str = None) -> None:
         ContractMixin.__init__(self)
@@ -217,7 +240,9 @@ class ShallowHistoryState(ContractMixin, StateMixin, ActionStateMixin, HistorySt
         HistoryStateMixin.__init__(self, memory)
 
     def __eq__(self, other):
-        if isinstance(other, ShallowHistoryState):
+        if self is other:
+            return True
+        elif isinstance(other, ShallowHistoryState):
             return (
                 ContractMixin.__eq__(self, other)
                 and StateMixin.__eq__(self, other)
@@ -239,6 +264,8 @@ class DeepHistoryState(ContractMixin, StateMixin, ActionStateMixin, HistoryState
     :param memory: name of the initial state
     """
 
+    __slots__ = ['_name', 'on_entry', 'on_exit', 'memory']
+
     def __init__(self, name: str, on_entry: str = None,
                  on_exit: str = None, memory: str = None) -> None:
         ContractMixin.__init__(self)
@@ -247,7 +274,9 @@ class DeepHistoryState(ContractMixin, StateMixin, ActionStateMixin, HistoryState
         HistoryStateMixin.__init__(self, memory)
 
     def __eq__(self, other):
-        if isinstance(other, DeepHistoryState):
+        if self is other:
+            return True
+        elif isinstance(other, DeepHistoryState):
             return (
                 ContractMixin.__eq__(self, other)
                 and StateMixin.__eq__(self, other)
@@ -267,13 +296,17 @@ class FinalState(ContractMixin, StateMixin, ActionStateMixin):
     :param on_exit: code to execute when state is exited
     """
 
+    __slots__ = ['_name', 'on_entry', 'on_exit']
+
     def __init__(self, name: str, on_entry: str = None, on_exit: str = None) -> None:
         ContractMixin.__init__(self)
         StateMixin.__init__(self, name)
         ActionStateMixin.__init__(self, on_entry, on_exit)
 
     def __eq__(self, other):
-        if isinstance(other, FinalState):
+        if self is other:
+            return True
+        elif isinstance(other, FinalState):
             return (
                 ContractMixin.__eq__(self, other)
                 and StateMixin.__eq__(self, other)
@@ -302,6 +335,8 @@ class Transition(ContractMixin):
     DEFAULT_PRIORITY = 0
     HIGH_PRIORITY = 1
 
+    __slots__ = ['_source', '_target', 'event', 'guard', 'action', 'priority']
+
     def __init__(self, source: str, target: str = None, event: str = None, guard: str = None,
                  action: str = None, priority=None) -> None:
         ContractMixin.__init__(self)
@@ -27,7 +27,9 @@ class Event:
         self.data = additional_parameters
 
     def __eq__(self, other):
-        if isinstance(other, Event):
+        if self is other:
+            return True
+        elif isinstance(other, Event):
             return (self.name == other.name and self.data == other.data)
         else:
             return NotImplemented
@@ -65,7 +67,8 @@ class InternalEvent(Event):
     """
     Subclass of Event that represents an internal event.
     """
-    pass
+
+    __slots__ = []
 
 
 class DelayedEvent(Event):
@@ -75,6 +78,8 @@ class DelayedEvent(Event):
     Deprecated since 1.4.0, use `Event` with a `delay` parameter instead.
     """
 
+    __slots__ = []
+
     def __init__(self, name: str, delay: float, **additional_parameters: Any) -> None:
         warnings.warn(
             'DelayedEvent is deprecated since 1.4.0, use Event with a delay parameter instead.',
@@ -86,4 +91,5 @@ class MetaEvent(Event):
     """
     Subclass of Event that represents a MetaEvent, as used in property statecharts.
     """
-    pass
+
+    __slots__ = []
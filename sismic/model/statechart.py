@@ -1,5 +1,7 @@
+from collections import deque
 from copy import deepcopy
-from typing import Callable, Dict, Iterable, List, Optional, Union, cast
+from typing import (Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union,
+                    cast)
 
 from ..exceptions import StatechartError
 
@@ -30,15 +32,19 @@ class Statechart:
 
         self._children[None] = []  # Root state
 
+        # Ancestors (by decreasing depth) and descendants (by increasing depth) of each state.
+        # Invalidated on structural changes.
+        self._ancestors = {}  # type: Dict[str, Tuple[str, ...]]
+        self._ancestor_sets = {}  # type: Dict[str, FrozenSet[str]]
+        self._descendants = {}  # type: Dict[str, Tuple[str, ...]]
+
     @property
     def root(self) -> Optional[str]:
         """
         Root state name
         """
-        for name, parent in self._parent.items():
-            if parent is None:
-                return name
-        return None
+        roots = self._children[None]
+        return roots[0] if roots else None
 
     @property
     def preamble(self):
@@ -108,12 +114,55 @@ class Statechart:
         """
         self.state_for(name)  # Raise StatechartError if state does not exist
 
-        ancestors = []
+        return list(self._ancestors_for(name))
+
+    def _ancestors_for(self, name: str) -> Tuple[str, ...]:
+        """
+        Return the ancestors of given existing state, computing and caching them if needed.
+
+        :param name: name of the state
+        :return: a tuple of state's ancestors, by decreasing depth
+        """
+        try:
+            return self._ancestors[name]
+        except KeyError:
+            pass
+
+        # Walk up the hierarchy until the root or a state with cached ancestors is reached
+        uncached = [name]
         parent = self._parent[name]
-        while parent:
-            ancestors.append(parent)
+        while parent and parent not in self._ancestors:
+            uncached.append(parent)
             parent = self._parent[parent]
-        return ancestors
+
+        # Cache the ancestors of the visited states, from the shallowest to the deepest one
+        ancestors = (parent,) + self._ancestors[parent] if parent else ()
+        for state in reversed(uncached):
+            self._ancestors[state] = ancestors
+            ancestors = (state,) + ancestors
+        return self._ancestors[name]
+
+    def _ancestor_set_for(self, name: str) -> FrozenSet[str]:
+        """
+        Return the ancestors of given existing state as a set, computing and caching it if needed.
+
+        :param name: name of the state
+        :return: a frozenset of state's ancestors
+        """
+        try:
+            return self._ancestor_sets[name]
+        except KeyError:
+            ancestors = self._ancestor_sets[name] = frozenset(self._ancestors_for(name))
+            return ancestors
+
+    def _clear_caches(self) -> None:
+        """
+        Clear the cached ancestors and descendants of states.
+        Must be called whenever the hierarchy of states changes.
+        """
+        self._ancestors.clear()
+        self._ancestor_sets.clear()
+        self._descendants.clear()
 
     def descendants_for(self, name: str) -> List[str]:
         """
@@ -126,13 +175,19 @@ class Statechart:
         """
         self.state_for(name)  # Raise StatechartError if state does not exist
 
+        try:
+            return list(self._descendants[name])
+        except KeyError:
+            pass
+
         descendants = []
-        states_to_consider = [name]
+        states_to_consider = deque([name])
         while states_to_consider:
-            name = states_to_consider.pop(0)
-            for child in self.children_for(name):
-                states_to_consider.append(child)
-                descendants.append(child)
+            children = self._children[states_to_consider.popleft()]
+            states_to_consider.extend(children)
+            descendants.extend(children)
+
+        self._descendants[name] = tuple(descendants)
         return descendants
 
     def depth_for(self, name: str) -> int:
@@ -145,8 +200,7 @@ class Statechart:
         """
         self.state_for(name)  # Raise StatechartError if state does not exist
 
-        ancestors = self.ancestors_for(name)
-        return len(ancestors) + 1
+        return len(self._ancestors_for(name)) + 1
 
     def least_common_ancestor(self, name_first: str, name_second: str) -> Optional[str]:
         """
@@ -161,9 +215,10 @@ class Statechart:
         self.state_for(name_first)  # Raise StatechartError if state does not exist
         self.state_for(name_second)
 
-        s1_anc = self.ancestors_for(name_first)
-        s2_anc = self.ancestors_for(name_second)
-        for state in s1_anc:
+        s2_anc = self._ancestor_set_for(name_second)
+
+        # Ancestors are ordered by decreasing depth, so the first match is the deepest one
+        for state in self._ancestors_for(name_first):
             if state in s2_anc:
                 return state
         return None
@@ -179,17 +234,19 @@ class Statechart:
         :return: the names of the leaves in *names*
         :raise StatechartError: if a state does not exist
         """
-        leaves = []  # type: List[str]
         names = set(names)  # Lookups in set are more efficient
+        non_leaves = set()  # type: Set[str]
 
         for name in names:
+            # Walk up the hierarchy and flag every ancestor that is in names.
             # Raise a StatechartError if it does not exist!
-            for descendant in self.descendants_for(name):
-                if descendant in names:
-                    break
-            else:  # no break occurs
-                leaves.append(name)
-        return leaves
+            parent = self.parent_for(name)
+            while parent and parent not in non_leaves:
+                if parent in names:
+                    non_leaves.add(parent)
+                parent = self._parent[parent]
+
+        return [name for name in names if name not in non_leaves]
 
     # ######### TRANSITIONS ##########
 
@@ -359,12 +416,14 @@ class Statechart:
         :param parent: name of its parent, or None
         :raise StatechartError:
         """
+        name = state.name
+
         # Check state has a name
-        if state.name is None:
+        if name is None:
             raise StatechartError('State {} must have a name'.format(state))
 
         # Check name unicity
-        if state.name in self._states.keys():
+        if name in self._states:
             raise StatechartError('State {} already exists!'.format(state))
 
         if not parent:
@@ -390,10 +449,12 @@ class Statechart:
                     '{} cannot be used as a parent for {}'.format(parent_state, state))
 
         # Save state
-        self._states[state.name] = state
-        self._parent[state.name] = parent
-        self._children[state.name] = []
-        self._children[parent].append(state.name)
+        self._states[name] = state
+        self._parent[name] = parent
+        self._children[name] = []
+        self._children[parent].append(name)
+        for ancestor in self._ancestors_for(name):
+            self._descendants.pop(ancestor, None)
 
     def remove_state(self, name: str) -> None:
         """
@@ -428,6 +489,7 @@ class Statechart:
         self._states.pop(name)
         parent = self._parent.pop(name)
         self._children.pop(name)
+        self._clear_caches()
 
         self._children[parent].remove(name)
 
@@ -480,6 +542,8 @@ class Statechart:
         self._parent[new_name] = self._parent.pop(old_name)
         self._children[new_name] = self._children.pop(old_name)
 
+        self._clear_caches()
+
         # Rename state!
         state._name = new_name
 
@@ -508,6 +572,7 @@ class Statechart:
         self._parent[name] = new_parent
         self._children[old_parent].remove(name)
         self._children.setdefault(new_parent, []).append(name)
+        self._clear_caches()
 
         # Check memory property
         if isinstance(state, HistoryStateMixin):
@@ -547,7 +612,7 @@ class Statechart:
         :param replace: Name of the target state. Should refer to a StateMixin with no child.
         :param renaming_func: Optional callable to resolve conflicting names.
         """
-        if len(self.children_for(replace)) > 0:
+        if self.children_for(replace):
             raise StatechartError(
                 'State {} cannot be replaced while it has children.'.format(replace))
 
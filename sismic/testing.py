@@ -123,7 +123,7 @@ def transition_is_processed(steps: MacroSteps, transition: Optional[Transition]
 
     if transition is None:
         for step in steps:
-            if len(step.transitions) > 0:
+            if step.transitions:
                 return True
         return False
     else:
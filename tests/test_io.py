@@ -1,8 +1,11 @@
+from collections import OrderedDict
+
 import pytest
 
 from sismic.model import Statechart
 from sismic.exceptions import StatechartError
 from sismic.io import import_from_yaml, export_to_yaml, export_to_plantuml
+from sismic.io.datadict import export_to_dict, import_from_dict
 from sismic.io.plantuml import cli
 
 
@@ -115,6 +118,35 @@ class TestExportToYaml:
         compare_statecharts(example_from_docs, import_from_yaml(export_to_yaml(example_from_docs)))
 
 
+class TestExportToDict:
+    def test_identity_for_example_from_tests(self, example_from_tests):
+        compare_statecharts(example_from_tests, import_from_dict(export_to_dict(example_from_tests)))
+
+    def test_ordered_dicts(self, internal_statechart):
+        data = export_to_dict(internal_statechart)['statechart']
+        active = [s for s in data['root state']['states'] if s['name'] == 'active'][0]
+        assert type(data) is OrderedDict
+        assert type(data['root state']) is OrderedDict
+        assert type(active) is OrderedDict
+        assert type(active['transitions'][0]) is OrderedDict
+
+    def test_plain_dicts(self, internal_statechart):
+        data = export_to_dict(internal_statechart, ordered=False)['statechart']
+        active = [s for s in data['root state']['states'] if s['name'] == 'active'][0]
+        assert type(data) is dict
+        assert type(data['root state']) is dict
+        assert type(active) is dict
+        assert type(active['transitions'][0]) is dict
+
+    def test_keys_order(self, internal_statechart):
+        data = export_to_dict(internal_statechart)['statechart']
+        active = [s for s in data['root state']['states'] if s['name'] == 'active'][0]
+        assert list(data) == ['name', 'root state']
+        assert list(data['root state']) == ['name', 'initial', 'states']
+        assert list(active) == ['name', 'on entry', 'transitions']
+        assert list(active['transitions'][0]) == ['event', 'target']
+
+
 class TestExportToPlantUML:
     def test_export_example_from_tests(self, example_from_tests):
         export = export_to_plantuml(
@@ -1,3 +1,7 @@
+import pickle
+import sys
+from copy import deepcopy
+
 import pytest
 
 from sismic.exceptions import StatechartError
@@ -36,6 +40,29 @@ class TestEvents:
         with pytest.raises(TypeError):
             Event('test', name='fail')
 
+    def test_hash(self):
+        event = Event('test', a=1)
+        assert hash(event) == hash(Event('test'))
+        assert hash(pickle.loads(pickle.dumps(event))) == hash(event)
+
+        event.name = 'other'
+        assert event.name == 'other'
+        assert hash(event) == hash(Event('other'))
+
+
+class TestStates:
+    def test_equality(self):
+        state = BasicState('a', on_entry='x = 1', on_exit='x = 2')
+        assert state == state
+        assert state == deepcopy(state)
+        assert state == BasicState('a', on_entry='x = 1', on_exit='x = 2')
+        assert state != BasicState('a', on_entry='x = 2', on_exit='x = 2')
+        assert state != BasicState('a', on_entry='x = 1', on_exit='x = 1')
+
+        compound = CompoundState('b', on_entry='y = 1')
+        assert compound == compound
+        assert compound == deepcopy(compound)
+
 
 class TestStatechartTraveral:
     def test_parent(self, composite_statechart):
@@ -78,6 +105,39 @@ class TestStatechartTraveral:
         assert sorted(composite_statechart.leaf_for(['s1', 's2'])) == ['s1', 's2']
         assert sorted(composite_statechart.leaf_for(['s1', 's1b1', 's2'])) == ['s1b1', 's2']
         assert sorted(composite_statechart.leaf_for(['s1', 's1b', 's1b1'])) == ['s1b1']
+        assert sorted(composite_statechart.leaf_for(['root', 's1a', 's1b1'])) == ['s1a', 's1b1']
+
+        with pytest.raises(StatechartError):
+            composite_statechart.leaf_for(['s1', 'unknown'])
+
+    def test_caches_after_structural_changes(self, composite_statechart):
+        sc = composite_statechart
+        assert sc.least_common_ancestor('s1b1', 's1b2') == 's1b'
+        assert sorted(sc.descendants_for('s1b')) == ['s1b1', 's1b2']
+        assert sorted(sc.leaf_for(['s1', 's1b', 's1b1'])) == ['s1b1']
+
+        sc.rename_state('s1b', 'new s1b')
+        assert sc.least_common_ancestor('s1b1', 's1b2') == 'new s1b'
+        assert sc.ancestors_for('s1b1') == ['new s1b', 's1', 'root']
+        assert sorted(sc.descendants_for('new s1b')) == ['s1b1', 's1b2']
+        assert sorted(sc.leaf_for(['s1', 'new s1b', 's1b1'])) == ['s1b1']
+
+        sc.remove_state('s1b1')
+        assert sc.descendants_for('new s1b') == ['s1b2']
+        assert sc.leaf_for(['s1', 'new s1b']) == ['new s1b']
+        assert sc.least_common_ancestor('s1b2', 's1a') == 's1'
+
+    def test_deep_hierarchy(self):
+        depth = sys.getrecursionlimit() + 100
+        sc = Statechart('test')
+        sc.add_state(CompoundState('s0'), None)
+        for i in range(1, depth):
+            sc.add_state(CompoundState('s{}'.format(i)), parent='s{}'.format(i - 1))
+
+        sc.rename_state('s0', 'root')  # Clear caches
+        assert sc.depth_for('s{}'.format(depth - 1)) == depth
+        assert sc.ancestors_for('s2') == ['s1', 'root']
+        assert sc.least_common_ancestor('s{}'.format(depth - 1), 's3') == 's2'
 
     def test_events_for(self, composite_statechart):
         assert set(composite_statechart.events_for()) == {'click', 'close', 'validate'}
@@ -326,8 +386,10 @@ class TestStatechartStates:
         internal_statechart.validate()
 
     def test_remove_nested_states(self, composite_statechart):
+        assert 's1a' in composite_statechart.descendants_for('root')
         composite_statechart.remove_state('s1')
         assert 's1a' not in composite_statechart.states
+        assert composite_statechart.descendants_for('root') == ['s2']
         composite_statechart.validate()
 
     def test_remove_nested_states_continued(self, composite_statechart):
@@ -395,6 +457,7 @@ class TestStatechartStates:
         assert 'new s1' in composite_statechart.states
         assert 'new s1' == composite_statechart.parent_for('s1a')
         assert 'new s1' in composite_statechart.children_for('root')
+        assert composite_statechart.ancestors_for('s1b1') == ['s1b', 'new s1', 'root']
 
         composite_statechart.state_for('new s1')
         composite_statechart.children_for('new s1')
@@ -426,6 +489,7 @@ class TestStatechartStates:
         assert 'new root' in internal_statechart.states
         assert 'root' not in internal_statechart.states
 
+        assert internal_statechart.root == 'new root'
         assert internal_statechart.parent_for('new root') is None
         assert internal_statechart.parent_for('active') == 'new root'
         assert 'active' in internal_statechart.children_for('new root')
@@ -444,10 +508,16 @@ class TestStatechartStates:
         history_statechart.validate()
 
     def test_move_simple(self, composite_statechart):
+        assert sorted(composite_statechart.leaf_for(['s1b1', 's1b2'])) == ['s1b1', 's1b2']
         composite_statechart.move_state('s1b2', 's1b1')
+        assert composite_statechart.leaf_for(['s1b1', 's1b2']) == ['s1b2']
         assert 's1b2' in composite_statechart.children_for('s1b1')
         assert 's1b2' not in composite_statechart.children_for('s1b')
         assert 's1b1' == composite_statechart.parent_for('s1b2')
+        assert composite_statechart.ancestors_for('s1b2') == ['s1b1', 's1b', 's1', 'root']
+        assert composite_statechart.depth_for('s1b2') == 5
+        assert composite_statechart.descendants_for('s1b') == ['s1b1', 's1b2']
+        assert composite_statechart.descendants_for('s1b1') == ['s1b2']
         composite_statechart.validate()
 
     def test_move_composite(self, composite_statechart):
@@ -455,6 +525,8 @@ class TestStatechartStates:
         assert 's1b' in composite_statechart.children_for('s1a')
         assert 's1b' not in composite_statechart.children_for('s1')
         assert 's1a' == composite_statechart.parent_for('s1b')
+        assert composite_statechart.ancestors_for('s1b1') == ['s1b', 's1a', 's1', 'root']
+        assert composite_statechart.least_common_ancestor('s1b1', 's1a') == 's1'
         composite_statechart.validate()
 
     def test_move_to_descendant(self, composite_statechart):